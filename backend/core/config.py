@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https:
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "google/gemini-2.0-flash-001")
+    FAST_START: bool = os.getenv("FAST_START", "false").lower() == "true"
+    WARMUP_ON_START: bool = os.getenv("WARMUP_ON_START", "false").lower() == "true"
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    SCHEMA_CACHE_TTL: int = int(os.getenv("SCHEMA_CACHE_TTL", "60"))
 
     class Config:
         extra = "ignore"
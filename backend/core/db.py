@@ -1,14 +1,18 @@
+import time
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
+from core.config import settings
 from core.schema_utils import get_collection_schema
 
-def get_db_client(uri: str):
+_schema_cache = {}
+
+def get_db_client(uri: str, min_pool_size: int = 0):
     """
     Connects to MongoDB and returns the client if connection is successful.
     Raises an exception if it fails.
     """
     try:
-        client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+        client = MongoClient(uri, serverSelectionTimeoutMS=5000, minPoolSize=min_pool_size)
         client.admin.command('ping')
         return client
     except Exception as e:
@@ -27,4 +31,22 @@ def get_full_db_schema(db, limit: int = 5):
             full_schema[coll_name] = get_collection_schema(db, coll_name, limit)
     except Exception as e:
         print(f"Schema fetching warning: {e}")
-    return full_schema
\ No newline at end of file
+    return full_schema
+
+def get_cached_db_schema(db, limit: int = 5):
+    """
+    Returns the full schema for db, reusing a cached copy for SCHEMA_CACHE_TTL seconds.
+    """
+    cached = _schema_cache.get(db.name)
+    if cached and time.monotonic() - cached[0] < settings.SCHEMA_CACHE_TTL:
+        return cached[1]
+    full_schema = get_full_db_schema(db, limit)
+    if full_schema:
+        _schema_cache[db.name] = (time.monotonic(), full_schema)
+    return full_schema
+
+def clear_schema_cache():
+    """
+    Drops cached schemas; call after collections are created, dropped or the connection changes.
+    """
+    _schema_cache.clear()
@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from core.config import settings
+from core.db import get_db_client, get_cached_db_schema
+
+startup_state = {
+    "startup": "starting",
+    "error": None,
+    "attempts": 0,
+    "import_seconds": None,
+    "time_to_ready_seconds": None,
+}
+
+startup_stop = threading.Event()
+
+def reset_startup_state():
+    """
+    Clears the per-run startup fields so each lifespan starts from a clean slate.
+    """
+    startup_stop.clear()
+    startup_state.update({
+        "startup": "starting",
+        "error": None,
+        "attempts": 0,
+        "time_to_ready_seconds": None,
+    })
+
+def connect_default(active_clients: dict) -> str:
+    """
+    Connects to the configured MongoDB URI and registers it as the default client,
+    unless a default connection was already set up (e.g. via /connect) meanwhile.
+    Returns "connected", "already_registered" or "unconfigured".
+    """
+    uri = settings.TEST_URL or settings.MONGO_DEFAULT_URI
+    if not uri:
+        return "unconfigured"
+    if "default" in active_clients:
+        return "already_registered"
+    client = get_db_client(uri, settings.MONGO_MIN_POOL_SIZE)
+    db = client.get_default_database()
+    if db is None:
+        db_name = client.list_database_names()[0]
+        db = client[db_name]
+    entry = {"client": client, "db": db}
+    if active_clients.setdefault("default", entry) is not entry:
+        client.close()
+        print("Default MongoDB connection already registered; discarded startup client.")
+        return "already_registered"
+    print(f"Connected to MongoDB: {db.name}")
+    return "connected"
+
+def warm_up(active_clients: dict):
+    """
+    Loads the lazily imported dependencies, opens pooled Mongo connections with
+    concurrent pings and fills the schema cache used by /query.
+    """
+    import pandas  # noqa: F401
+    from services.llm_engine import llm_engine
+    _ = llm_engine.client
+    if "default" not in active_clients:
+        return
+    client = active_clients["default"]["client"]
+    pool_size = max(settings.MONGO_MIN_POOL_SIZE, 1)
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        list(executor.map(lambda _: client.admin.command('ping'), range(pool_size)))
+    schema = get_cached_db_schema(active_clients["default"]["db"])
+    print(f"Warm-up opened {pool_size} connections and cached schema for {len(schema)} collections.")
+
+def start_up(active_clients: dict, started_at: float, retry: bool = False):
+    """
+    Runs the connection (and optional warm-up) and records status and timing.
+    With retry=True, failed connection attempts are retried with capped exponential backoff.
+    """
+    delay = 1.0
+    while True:
+        startup_state["attempts"] += 1
+        try:
+            result = connect_default(active_clients)
+            startup_state["error"] = None
+            break
+        except Exception as e:
+            startup_state["error"] = str(e)
+            print(f"Failed to auto-connect to MongoDB (attempt {startup_state['attempts']}): {e}")
+        if not retry:
+            startup_state["startup"] = "failed"
+            return
+        startup_state["startup"] = "retrying"
+        if startup_stop.wait(delay):
+            startup_state["startup"] = "stopped"
+            return
+        delay = min(delay * 2, 30.0)
+
+    startup_state["startup"] = result
+    if result == "unconfigured":
+        print("No MongoDB URI configured; skipping auto-connect.")
+        return
+    if result == "connected":
+        startup_state["time_to_ready_seconds"] = round(time.perf_counter() - started_at, 3)
+        print(f"Database ready after {startup_state['time_to_ready_seconds']}s")
+
+    if settings.WARMUP_ON_START and not startup_stop.is_set():
+        try:
+            warm_up(active_clients)
+        except Exception as e:
+            print(f"Warm-up failed: {e}")
@@ -1,4 +1,8 @@
+import time
+_import_started = time.perf_counter()
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings
 from routers.connection import router as connection_router
@@ -7,24 +11,24 @@ from routers.query import router as query_router
 from routers.export import router as export_router
 from routers.collection_management import router as collection_management_router
 from routers.connection import active_clients
-from core.db import get_db_client
+from core.startup import startup_state, startup_stop, reset_startup_state, start_up
 from contextlib import asynccontextmanager
 
+startup_state["import_seconds"] = round(time.perf_counter() - _import_started, 3)
+print(f"Application modules imported in {startup_state['import_seconds']}s")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    uri = settings.TEST_URL or settings.MONGO_DEFAULT_URI
-    if uri:
-        try:
-            client = get_db_client(uri)
-            db = client.get_default_database()
-            if db is None:
-                db_name = client.list_database_names()[0]
-                db = client[db_name]
-            active_clients["default"] = {"client": client, "db": db}
-            print(f"Connected to MongoDB: {db.name}")
-        except Exception as e:
-            print(f"Failed to auto-connect to MongoDB: {e}")
+    started_at = time.perf_counter()
+    reset_startup_state()
+    if settings.FAST_START:
+        startup_task = asyncio.create_task(asyncio.to_thread(start_up, active_clients, started_at, True))
+    else:
+        start_up(active_clients, started_at)
     yield
+    if settings.FAST_START and not startup_task.done():
+        startup_stop.set()
+        await startup_task
     if "default" in active_clients:
         active_clients["default"]["client"].close()
         print("MongoDB connection closed.")
@@ -53,6 +57,15 @@ def health_check():
     """
     return {"status": "ok", "message": "ZERO ONE AI Backend is running."}
 
+@app.get("/ready", tags=["health"])
+def readiness_check():
+    """
+    Readiness endpoint; returns 503 while no default database connection is registered.
+    """
+    ready = "default" in active_clients
+    body = {"status": "ready" if ready else startup_state["startup"], **startup_state}
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
 
 app.include_router(connection_router, prefix=f"{settings.API_V1_STR}", tags=["connection"])
 app.include_router(upload_router, prefix=f"{settings.API_V1_STR}", tags=["upload"])
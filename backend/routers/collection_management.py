@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from routers.connection import active_clients
+from core.db import clear_schema_cache
 
 router = APIRouter()
 
@@ -15,6 +16,7 @@ async def delete_collection(collection_name: str):
         if collection_name not in db.list_collection_names():
             raise HTTPException(status_code=404, detail=f"Collection '{collection_name}' not found.")
         db[collection_name].drop()
+        clear_schema_cache()
         collections = db.list_collection_names()
         return {
             "status": "success",
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from models.connection import ConnectRequest, ConnectResponse, SchemaResponse
-from core.db import get_db_client, get_collection_schema
+from core.config import settings
+from core.db import get_db_client, get_collection_schema, clear_schema_cache
 
 router = APIRouter()
 
@@ -11,13 +12,14 @@ active_clients = {}
 @router.post("/connect", response_model=ConnectResponse)
 def connect_to_mongo(req: ConnectRequest):
     try:
-        client = get_db_client(req.uri)
+        client = get_db_client(req.uri, settings.MONGO_MIN_POOL_SIZE)
         db = client.get_default_database()
         if db is None:
             db_name = client.list_database_names()[0]
             db = client[db_name]
         collections = db.list_collection_names()
         active_clients["default"] = {"client": client, "db": db}
+        clear_schema_cache()
         return {
             "status": "success",
             "message": f"Connected to MongoDB database: {db.name}",
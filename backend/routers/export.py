@@ -2,7 +2,6 @@ from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
-import pandas as pd
 import io
 
 router = APIRouter()
@@ -11,6 +10,7 @@ class ExportRequest(BaseModel):
     data: List[Dict[str, Any]]
 @router.post("/csv")
 def export_csv(req: ExportRequest):
+    import pandas as pd
     df = pd.DataFrame(req.data)
     stream = io.StringIO()
     df.to_csv(stream, index=False)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 from routers.connection import active_clients
-from core.db import get_full_db_schema
+from core.db import get_cached_db_schema
 from services.llm_engine import llm_engine
 from services.query_validator import validate_pipeline
 from services.analytics import analyze_data
@@ -29,7 +29,7 @@ async def process_natural_language_query(request: NLQueryRequest):
             raise HTTPException(status_code=400, detail="Database not connected.")
         db = active_clients["default"]["db"]
         col_name = request.collection_name
-        full_schema = get_full_db_schema(db)
+        full_schema = get_cached_db_schema(db)
         structured_query, detected_lang = await llm_engine.generate_query(request.query, full_schema, col_name)
         intent = structured_query.get("intent", "analytical")
 
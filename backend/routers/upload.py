@@ -2,7 +2,7 @@ import json
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from routers.connection import active_clients
 from core.config import settings
-from core.db import get_db_client
+from core.db import get_db_client, clear_schema_cache
 
 router = APIRouter()
 
@@ -17,7 +17,7 @@ async def upload_json(file: UploadFile = File(...)):
         if not fallback_uri:
             raise HTTPException(status_code=400, detail="No active database connection. Please connect first.")
         try:
-            client = get_db_client(fallback_uri)
+            client = get_db_client(fallback_uri, settings.MONGO_MIN_POOL_SIZE)
             db = client.get_default_database()
             if db is None:
                 db_name = client.list_database_names()[0]
@@ -59,6 +59,7 @@ async def upload_json(file: UploadFile = File(...)):
 
     collection = db[col_name]
     collection.insert_many(data)
+    clear_schema_cache()
 
     print(f"[Upload] Loaded {len(data)} records into collection: {col_name}")
 
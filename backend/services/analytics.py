@@ -1,4 +1,3 @@
-import pandas as pd
 from typing import List, Dict, Any
 
 def analyze_data(data: List[Dict[str, Any]]) -> dict:
@@ -7,6 +6,7 @@ def analyze_data(data: List[Dict[str, Any]]) -> dict:
     """
     if not data:
         return {"metrics": {}, "trend": "No data available."}
+    import pandas as pd
     df = pd.DataFrame(data)
     numeric_cols = df.select_dtypes(include=['number', 'float64', 'int64']).columns
     metrics = {}
@@ -1,21 +1,28 @@
 import json
-from openai import AsyncOpenAI
 from core.config import settings
 from core.serialization_utils import json_serializable
 
 class LLMEngine:
     def __init__(self):
-        self.client = None
-        if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                base_url=settings.OPENAI_BASE_URL
-            )
+        self._client = None
         self.model = settings.OPENAI_MODEL
         print(f"LLM Engine initialized using model: {self.model}")
         print(f"Base URL: {settings.OPENAI_BASE_URL}")
         print(f"API Key configured: {'Yes' if settings.OPENAI_API_KEY else 'No'}")
 
+    @property
+    def client(self):
+        """
+        Builds the OpenAI client on first use so importing this module stays cheap.
+        """
+        if self._client is None and settings.OPENAI_API_KEY:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL
+            )
+        return self._client
+
     async def generate_query(self, user_question: str, schema_info: dict, collection_name: str) -> dict:
         """
         Detects the language and intent (analytical vs conversational) of the user's question.